@@ -1,81 +1,91 @@
 import json
 import time
 import requests
-import pyttsx3
-import pyaudio
-from vosk import Model, KaldiRecognizer
 import os
 import sys
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 
-
-class Speech:
-    def __init__(self, lang='en'):
-        self.tts = pyttsx3.init()
-        self.set_voice(lang)
-
-    def set_voice(self, lang_code):
-        voices = self.tts.getProperty('voices')
-        for voice in voices:
-            if lang_code in ''.join(voice.languages).lower():
-                self.tts.setProperty('voice', voice.id)
-                return
-        # fallback to default voice
-
-    def speak(self, text):
-        print(f"Assistant: {text}")
-        self.tts.say(text)
-        self.tts.runAndWait()
-
-class Recognizer:
-    def __init__(self, model_path, rate=16000, buffer=8000):
-        if not os.path.exists(model_path):
-            model_path = os.path.join(os.getcwd(), model_path)
-        self.model = Model(model_path)
-        self.recognizer = KaldiRecognizer(self.model, rate)
-        self._init_stream(rate, buffer)
-
-    def _init_stream(self, rate, buffer):
-        pa = pyaudio.PyAudio()
-        self.stream = pa.open(
-            format=pyaudio.paInt16,
-            channels=1,
-            rate=rate,
-            input=True,
-            frames_per_buffer=buffer,
-        )
-
-    def listen(self):
-        try:
-            while True:
-                data = self.stream.read(4000, exception_on_overflow=False)
-                if self.recognizer.AcceptWaveform(data):
-                    result = json.loads(self.recognizer.Result())
-                    text = result.get('text', '').strip()
-                    if text:
-                        yield text.lower()
-        except KeyboardInterrupt:
-            return
+from voice import Speech, Recognizer
 
 
 class DictionaryAPI:
     BASE_URL = 'https://api.dictionaryapi.dev/api/v2/entries/en/'
+    CACHE_DIR = 'dictionary_cache'
+    CACHE_TTL = 24 * 60 * 60  # the API itself caches entries for 24h
 
     def __init__(self):
         self.entry = None
+        self._memo = {}
+        self.session = requests.Session()
+        self.session.mount('https://', requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=16))
+        self.session.headers['Accept-Encoding'] = 'gzip'
+
+    def _cache_path(self, word):
+        return os.path.join(self.CACHE_DIR, f"{word}.json")
+
+    def _load_cached(self, word):
+        if word in self._memo:
+            return self._memo[word]
+        path = self._cache_path(word)
+        if os.path.exists(path) and time.time() - os.path.getmtime(path) < self.CACHE_TTL:
+            try:
+                with open(path, encoding='utf-8') as f:
+                    entry = json.load(f)
+                self._memo[word] = entry
+                return entry
+            except (OSError, ValueError):
+                pass
+        return None
+
+    def _store_cached(self, word, entry):
+        self._memo[word] = entry
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            with open(self._cache_path(word), 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+        except OSError:
+            pass  # cache is best-effort; the lookup itself succeeded
 
     def find_word(self, word):
+        word = word.lower()
+        cached = self._load_cached(word)
+        if cached is not None:
+            self.entry = cached
+            return True, None
         try:
-            res = requests.get(f"{self.BASE_URL}{word}")
+            res = self.session.get(f"{self.BASE_URL}{word}", timeout=5)
             res.raise_for_status()
             data = res.json()
             self.entry = data[0]
+            self._store_cached(word, self.entry)
             return True, None
         except requests.RequestException as e:
             return False, str(e)
         except (IndexError, ValueError):
             return False, 'No entry found.'
 
+    def warm_cache(self, folder='dictionary_entries'):
+        """
+        Prime the in-process cache with entries saved in previous runs,
+        so those words resolve without any network traffic.
+        """
+        if not os.path.isdir(folder):
+            return 0
+        loaded = 0
+        for name in os.listdir(folder):
+            if not name.endswith('.json'):
+                continue
+            word = name[:-len('.json')].lower()
+            try:
+                with open(os.path.join(folder, name), encoding='utf-8') as f:
+                    self._memo[word] = json.load(f)
+                loaded += 1
+            except (OSError, ValueError):
+                continue
+        return loaded
+
     def save(self, folder='dictionary_entries'):
         if not self.entry:
             return False, 'No word selected.'
@@ -128,6 +138,8 @@ if __name__ == '__main__':
     speech = Speech(lang='en')
     recognizer = Recognizer(MODEL_PATH)
     dictionary = DictionaryAPI()
+    dictionary.warm_cache()
+    executor = ThreadPoolExecutor(max_workers=2)
 
     # Initial prompts in English
     speech.speak("Dictionary assistant activated. Say 'find <word>' or 'найти <word>'.")
@@ -145,7 +157,11 @@ if __name__ == '__main__':
             word = None
 
         if word:
-            ok, err = dictionary.find_word(word)
+            # Run the lookup in the background so the network round-trip
+            # overlaps with the spoken acknowledgement.
+            future = executor.submit(dictionary.find_word, word)
+            speech.speak(f"Looking up {word}.")
+            ok, err = future.result()
             speech.speak(f"Word '{word}' found." if ok else f"Error: {err}")
             continue
 
@@ -153,6 +169,7 @@ if __name__ == '__main__':
         action = COMMANDS.get(cmd)
         if action == 'exit':
             speech.speak('Goodbye!')
+            speech.flush()
             break
         if not action:
             speech.speak("Unknown command. Use save/сохранить, meaning/значение, example/пример, link/ссылка, or exit/выход.")
@@ -1,99 +1,82 @@
-import json
 import time
 import requests
-import pyttsx3
-import pyaudio
-from vosk import Model, KaldiRecognizer
 import random
+import string
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 from io import BytesIO
 import os
 import sys
 
+from voice import Speech, Recognizer
+
+
+# Deletion table for filenames: strips everything except letters,
+# digits, spaces and underscores in one C-level pass.
+_ALLOWED = frozenset(string.ascii_letters + string.digits + ' _')
+_SANITIZE_TABLE = str.maketrans(
+    '', '', ''.join(chr(i) for i in range(256) if chr(i) not in _ALLOWED))
 
-class Speech:
-    def __init__(self, lang='ru'):
-        self.tts = pyttsx3.init()
-        self.lang = lang
-        self.set_voice(self.lang)
-
-    def set_voice(self, lang_code):
-        """
-        Set TTS voice based on language code (e.g., 'ru', 'en').
-        """
-        voices = self.tts.getProperty('voices')
-        for voice in voices:
-            if lang_code in ''.join(voice.languages).lower():
-                self.tts.setProperty('voice', voice.id)
-                return
-        # fallback to default
-
-    def speak(self, text):
-        self.tts.say(text)
-        self.tts.runAndWait()
-
-class Recognizer:
-    def __init__(self, model_path, rate=16000, buffer=8000):
-        if not os.path.exists(model_path):
-            model_path = os.path.join(os.getcwd(), model_path)
-        self.model = Model(model_path)
-        self.recognizer = KaldiRecognizer(self.model, rate)
-        self._init_stream(rate, buffer)
-
-    def _init_stream(self, rate, buffer):
-        pa = pyaudio.PyAudio()
-        self.stream = pa.open(
-            format=pyaudio.paInt16,
-            channels=1,
-            rate=rate,
-            input=True,
-            frames_per_buffer=buffer,
-        )
-
-    def listen(self):
-        try:
-            while True:
-                data = self.stream.read(4000, exception_on_overflow=False)
-                if self.recognizer.AcceptWaveform(data):
-                    result = json.loads(self.recognizer.Result())
-                    text = result.get('text', '').strip()
-                    if text:
-                        yield text
-        except KeyboardInterrupt:
-            return
 
 class RickAndMortyAPI:
     BASE_URL = 'https://rickandmortyapi.com/api'
+    COUNT_TTL = 24 * 60 * 60  # the character count changes rarely
 
     def __init__(self):
         self.character = None
+        self._image_bytes = None
+        self._image_size = None
+        self._total = None
+        self._total_ts = 0
+        self.session = requests.Session()
+        # pool_block caps the socket count at pool_maxsize: the threaded
+        # episode fallback queues on the warm connections instead of
+        # opening (and discarding) extra TLS connections past the pool.
+        self.session.mount('https://', requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=8, pool_block=True))
+        self.session.headers['Accept-Encoding'] = 'gzip'
 
     def _fetch(self, endpoint):
         try:
-            res = requests.get(f"{self.BASE_URL}/{endpoint}")
+            res = self.session.get(f"{self.BASE_URL}/{endpoint}", timeout=5)
             res.raise_for_status()
             return res.json()
         except requests.RequestException as e:
             return {'error': str(e)}
 
     def random_character(self):
-        # fetch count
-        info = self._fetch('character')
-        total = info.get('info', {}).get('count', 826)
-        char_id = random.randint(1, total)
+        # refresh the character count at most once per TTL
+        if self._total is None or time.time() - self._total_ts > self.COUNT_TTL:
+            info = self._fetch('character')
+            self._total = info.get('info', {}).get('count', 826)
+            self._total_ts = time.time()
+        char_id = random.randint(1, self._total)
         data = self._fetch(f'character/{char_id}')
         if 'error' in data:
             return None, data['error']
         self.character = data
+        self._image_bytes = None
+        self._image_size = None
         return data['name'], None
 
+    def _get_image_bytes(self):
+        if self._image_bytes is None:
+            url = self.character['image']
+            # Reading raw directly yields one buffer; .content on a
+            # buffered response joins 10KB chunks, costing an extra
+            # full-image copy.
+            res = self.session.get(url, stream=True, timeout=5)
+            res.raw.decode_content = True
+            self._image_bytes = res.raw.read()
+            res.close()
+        return self._image_bytes
+
     def save_image(self, folder='images'):
         if not self.character:
             return None, 'Character not selected.'
         os.makedirs(folder, exist_ok=True)
-        url = self.character['image']
-        data = requests.get(url).content
-        safe_name = ''.join(c for c in self.character['name'] if c.isalnum() or c in (' ', '_')).strip()
+        data = self._get_image_bytes()
+        safe_name = self.character['name'].translate(_SANITIZE_TABLE).strip()
         path = os.path.join(folder, f"{safe_name}.jpg")
         with open(path, 'wb') as f:
             f.write(data)
@@ -109,17 +92,25 @@ class RickAndMortyAPI:
     def show_image(self):
         if not self.character:
             return None, 'Character not selected.'
-        url = self.character['image']
-        img = Image.open(BytesIO(requests.get(url).content))
+        img = Image.open(BytesIO(self._get_image_bytes()))
         img.show()
         return 'Image displayed.', None
 
     def image_resolution(self):
         if not self.character:
             return None, 'Character not selected.'
-        url = self.character['image']
-        img = Image.open(BytesIO(requests.get(url).content))
-        w, h = img.size
+        if self._image_size is None:
+            if self._image_bytes is not None:
+                img = Image.open(BytesIO(self._image_bytes))
+            else:
+                # Stream the response so PIL only reads the header bytes
+                # it needs for the size, instead of the whole image.
+                res = self.session.get(self.character['image'], stream=True, timeout=5)
+                res.raw.decode_content = True
+                img = Image.open(res.raw)
+                res.close()
+            self._image_size = img.size
+        w, h = self._image_size
         return f"{w}x{h}", None
 
     def origin(self):
@@ -135,15 +126,23 @@ class RickAndMortyAPI:
     def episodes_list(self):
         if not self.character:
             return None, 'Character not selected.'
-        eps = []
-        for url in self.character['episode']:
-            data = self._fetch_from_url(url)
-            eps.append(data.get('name'))
-        return eps, None
+        urls = self.character['episode']
+        # The API serves /episode/1,2,3 as one array, so all episodes
+        # come back in a single request instead of one per episode.
+        ids = ','.join(url.rsplit('/', 1)[-1] for url in urls)
+        data = self._fetch(f'episode/{ids}')
+        if 'error' in data:
+            # fall back to fetching each URL concurrently
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                results = list(ex.map(self._fetch_from_url, urls))
+            return [r.get('name') for r in results], None
+        if isinstance(data, dict):  # single-episode responses are an object
+            data = [data]
+        return [e.get('name') for e in data], None
 
     def _fetch_from_url(self, url):
         try:
-            r = requests.get(url)
+            r = self.session.get(url, timeout=5)
             r.raise_for_status()
             return r.json()
         except requests.RequestException:
@@ -161,10 +160,13 @@ COMMANDS = {
     'выход': 'exit'
 }
 
+# Longest phrases first, so 'список эпизодов' matches before 'эпизод'.
+COMMAND_ACTIONS = sorted(COMMANDS.items(), key=lambda item: -len(item[0]))
+
 if __name__ == '__main__':
     MODEL_PATH = sys.argv[1] if len(sys.argv) > 1 else 'vosk-model-small-ru-0.22'
     speech = Speech(lang='ru')
-    recognizer = Recognizer(MODEL_PATH)
+    recognizer = Recognizer(MODEL_PATH, grammar=list(COMMANDS) + ['прощаюсь'])
     api = RickAndMortyAPI()
 
     speech.speak("Голосовой ассистент Рик и Морти активирован.")
@@ -173,40 +175,50 @@ if __name__ == '__main__':
 
     for text in recognizer.listen():
         print(f"Распознано: {text}")
-        cmd = text.lower()
-        if 'выход' in cmd or 'прощаюсь' in cmd:
+        cmd = text.lower().strip()
+
+        # exact match first, then the longest phrase contained in the text
+        action = COMMANDS.get(cmd)
+        if action is None:
+            for phrase, candidate in COMMAND_ACTIONS:
+                if phrase in cmd:
+                    action = candidate
+                    break
+
+        if action == 'exit' or 'прощаюсь' in cmd:
             speech.speak('До скорых встреч!')
+            speech.flush()
             break
 
-        if 'случайный' in cmd:
+        if action == 'random':
             name, err = api.random_character()
             speech.speak(name if not err else err)
 
-        elif 'сохранить' in cmd:
+        elif action == 'save':
             path, err = api.save_image()
             speech.speak(f'Сохранено: {path}' if not err else err)
 
-        elif 'эпизод' in cmd:
+        elif action == 'first_ep':
             ep, err = api.first_episode()
             speech.speak(ep if not err else err)
 
-        elif 'список эпизодов' in cmd:
+        elif action == 'list_eps':
             eps, err = api.episodes_list()
             speech.speak(', '.join(eps) if not err else err)
 
-        elif 'показать' in cmd:
+        elif action == 'show_img':
             msg, err = api.show_image()
             speech.speak(msg if not err else err)
 
-        elif 'разрешение' in cmd:
+        elif action == 'resolution':
             res, err = api.image_resolution()
             speech.speak(f"Разрешение: {res}" if not err else err)
 
-        elif 'происхождение' in cmd:
+        elif action == 'origin':
             origin, err = api.origin()
             speech.speak(origin if not err else err)
 
-        elif 'локация' in cmd:
+        elif action == 'location':
             loc, err = api.location()
             speech.speak(loc if not err else err)
 
@@ -0,0 +1,113 @@
+import json
+import os
+import queue
+import re
+import threading
+
+import pyttsx3
+import pyaudio
+from vosk import Model, KaldiRecognizer
+
+
+_engine = None
+
+# Words worth reacting to before Vosk detects end-of-utterance silence.
+EXIT_WORDS = frozenset({'выход', 'закрыть', 'quit', 'exit'})
+
+# Vosk results are flat JSON like {"text": "..."}; slicing the field out
+# with a precompiled regex avoids a full JSON parse per utterance.
+_TEXT_RE = re.compile(r'"text"\s*:\s*"([^"]*)"')
+_PARTIAL_RE = re.compile(r'"partial"\s*:\s*"([^"]*)"')
+
+
+def get_engine():
+    """
+    Return the process-wide pyttsx3 engine, initializing it on first use.
+    pyttsx3.init() spawns a SAPI/eSpeak backend, so share one instance.
+    """
+    global _engine
+    if _engine is None:
+        _engine = pyttsx3.init()
+    return _engine
+
+
+class Speech:
+    def __init__(self, lang='en'):
+        self.tts = get_engine()
+        self.set_voice(lang)
+        self._q = queue.Queue()
+        self._worker = threading.Thread(target=self._speak_loop, daemon=True)
+        self._worker.start()
+
+    def set_voice(self, lang_code):
+        """
+        Set TTS voice based on language code (e.g., 'ru', 'en').
+        """
+        voices = self.tts.getProperty('voices')
+        for voice in voices:
+            if lang_code in ''.join(voice.languages).lower():
+                self.tts.setProperty('voice', voice.id)
+                return
+        # fallback to default voice
+
+    def _speak_loop(self):
+        while True:
+            text = self._q.get()
+            self.tts.say(text)
+            self.tts.runAndWait()
+            self._q.task_done()
+
+    def speak(self, text):
+        # queued so playback doesn't block the recognizer loop
+        print(f"Assistant: {text}")
+        self._q.put(text)
+
+    def flush(self):
+        """Block until everything queued so far has been spoken."""
+        self._q.join()
+
+
+class Recognizer:
+    def __init__(self, model_path, rate=16000, buffer=8000, grammar=None):
+        if not os.path.exists(model_path):
+            model_path = os.path.join(os.getcwd(), model_path)
+        self.model = Model(model_path)
+        if grammar:
+            # Constrain decoding to the known phrases; [unk] absorbs
+            # everything else. Searching this small graph is far cheaper
+            # and more accurate than open-vocabulary decoding.
+            phrases = json.dumps(list(grammar) + ['[unk]'], ensure_ascii=False)
+            self.recognizer = KaldiRecognizer(self.model, rate, phrases)
+        else:
+            self.recognizer = KaldiRecognizer(self.model, rate)
+        self._init_stream(rate, buffer)
+
+    def _init_stream(self, rate, buffer):
+        pa = pyaudio.PyAudio()
+        self.stream = pa.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=rate,
+            input=True,
+            frames_per_buffer=buffer,
+        )
+
+    def listen(self):
+        try:
+            while True:
+                data = self.stream.read(4000, exception_on_overflow=False)
+                if self.recognizer.AcceptWaveform(data):
+                    match = _TEXT_RE.search(self.recognizer.Result())
+                    text = match.group(1).strip() if match else ''
+                    if text:
+                        yield text.lower()
+                else:
+                    # Exit words are emitted from the partial result so the
+                    # assistant reacts without waiting for trailing silence.
+                    match = _PARTIAL_RE.search(self.recognizer.PartialResult())
+                    word = match.group(1).strip().lower() if match else ''
+                    if word in EXIT_WORDS:
+                        self.recognizer.Reset()
+                        yield word
+        except KeyboardInterrupt:
+            return